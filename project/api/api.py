@@ -1,38 +1,109 @@
-from fastapi import FastAPI, Query
-from pydantic import BaseModel
+from fastapi import FastAPI, Query, Request
+from pydantic import BaseModel, Field
 from typing import List, Optional
-from fastapi.responses import HTMLResponse
+from datetime import datetime
+from fastapi.responses import HTMLResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
-import os, json
+from fastapi.middleware.gzip import GZipMiddleware
+import os
+import asyncio
+import logging
+from bisect import bisect_right
+from heapq import merge
+from contextlib import asynccontextmanager
+from hashlib import blake2b
+import aiofiles
+import aiofiles.os
+import orjson
 
 # ---------- Storage ----------
 DATA_DIR = os.getenv("LEADERBOARD_DIR", os.path.dirname(__file__))
 LEADERBOARD_FILE = os.path.join(DATA_DIR, "leaderboard.json")
+FLUSH_DELAY = 0.5  # seconds to coalesce score submissions into one write
+SEARCH_CACHE_SIZE = 256  # distinct ?q= results (and bodies) kept between leaderboard changes
 
 class Score(BaseModel):
     player: str
     score: int
-    date: str
+    # stamped on arrival unless the client sends its own
+    date: str = Field(default_factory=lambda: datetime.now().isoformat())
 
-def load_leaderboard() -> List[dict]:
+def by_score_desc(entry: dict) -> int:
+    return -entry["score"]
+
+def leaderboard_mtime() -> int:
+    """Modification time of the leaderboard file in ns (0 if it does not exist)."""
+    try:
+        return os.stat(LEADERBOARD_FILE).st_mtime_ns
+    except OSError:
+        return 0
+
+async def load_leaderboard() -> List[dict]:
+    """Read entries from disk, sorted by score (highest first)."""
     if not os.path.exists(LEADERBOARD_FILE):
         return []
     try:
-        with open(LEADERBOARD_FILE, "r") as f:
-            data = json.load(f)
+        async with aiofiles.open(LEADERBOARD_FILE, "rb") as f:
+            data = orjson.loads(await f.read())
             if isinstance(data, list):
+                data.sort(key=by_score_desc)  # near O(n) when already sorted
                 return data
     except Exception:
         pass
     return []
 
-def save_leaderboard(entries: List[dict]):
-    os.makedirs(DATA_DIR, exist_ok=True)
-    with open(LEADERBOARD_FILE, "w") as f:
-        json.dump(entries, f, indent=2)
+async def save_leaderboard(entries: List[dict]):
+    global cache_mtime
+    payload = orjson.dumps(entries, option=orjson.OPT_INDENT_2)  # snapshot before yielding
+    await aiofiles.os.makedirs(DATA_DIR, exist_ok=True)
+    # write a temp file and swap it in, so readers never see a half-written file
+    tmp_file = LEADERBOARD_FILE + ".tmp"
+    async with aiofiles.open(tmp_file, "wb") as f:
+        await f.write(payload)
+    await aiofiles.os.replace(tmp_file, LEADERBOARD_FILE)
+    cache_mtime = leaderboard_mtime()  # our own write must not trigger a reload
+
+# ---------- Write-behind flusher ----------
+# Handlers only mark the cache dirty; one background task writes the file,
+# so a burst of submissions costs a single rewrite instead of one each.
+dirty = asyncio.Event()
+log = logging.getLogger(__name__)
+
+async def flusher():
+    while True:
+        await dirty.wait()
+        await asyncio.sleep(FLUSH_DELAY)
+        dirty.clear()
+        try:
+            await save_leaderboard(leaderboard)
+        except asyncio.CancelledError:
+            dirty.set()  # interrupted mid-write: let shutdown write it again
+            raise
+        except Exception:
+            # e.g. disk full: keep the scores in memory and retry after FLUSH_DELAY
+            log.exception("Failed to save leaderboard; will retry")
+            dirty.set()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    global dirty
+    dirty = asyncio.Event()  # bind to the server's running loop
+    await refresh_leaderboard()
+    task = asyncio.create_task(flusher())
+    try:
+        yield
+    finally:
+        task.cancel()
+        try:
+            await task
+        except (asyncio.CancelledError, Exception):
+            pass  # the final flush below still has to run
+        if dirty.is_set():  # don't lose scores still waiting for a flush
+            dirty.clear()
+            await save_leaderboard(leaderboard)
 
 # ---------- App ----------
-app = FastAPI(title="Snake Leaderboard")
+app = FastAPI(title="Snake Leaderboard", lifespan=lifespan)
 
 # Allow your game (and browsers) to fetch freely
 app.add_middleware(
@@ -41,9 +112,68 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+app.add_middleware(GZipMiddleware, minimum_size=256)
+
+# In-memory cache, kept sorted by score (highest first).
+# Reloaded only when the file's mtime changes behind our back.
+# Populated by the lifespan startup hook.
+leaderboard: List[dict] = []
+# names_lower[i] == leaderboard[i]["player"].lower(), computed once per entry
+# so searches never lowercase names on the request path.
+names_lower: List[str] = []
+cache_mtime: int = 0
+# Lowercased query -> indices of every match (in score order). Cleared on any change.
+search_cache: dict[str, List[int]] = {}
+# Lowercased query ("" = no filter) -> (JSON body, ETag) of the /leaderboard/ response.
+response_cache: dict[str, tuple[bytes, str]] = {}
 
-# In-memory cache (simple)
-leaderboard: List[dict] = load_leaderboard()
+def lower_name(entry: dict) -> str:
+    return entry.get("player", "").lower()
+
+def set_leaderboard(entries: List[dict]):
+    global leaderboard, names_lower
+    leaderboard = entries
+    names_lower = [lower_name(e) for e in entries]
+    clear_caches()
+
+def clear_caches():
+    search_cache.clear()
+    response_cache.clear()
+
+def mark_dirty():
+    clear_caches()
+    dirty.set()
+
+def search_leaderboard(q_low: str) -> List[int]:
+    """Indices of entries whose player name contains q_low, highest score first."""
+    hit = search_cache.get(q_low)
+    if hit is not None:
+        return hit
+    # Matches for "ana" are a subset of matches for "an": while the UI types a
+    # name, narrow the last cached prefix result instead of rescanning everything.
+    for i in range(len(q_low) - 1, 0, -1):
+        prev = search_cache.get(q_low[:i])
+        if prev is not None:
+            hit = [j for j in prev if q_low in names_lower[j]]
+            break
+    else:
+        hit = [j for j, name in enumerate(names_lower) if q_low in name]
+    if len(search_cache) >= SEARCH_CACHE_SIZE:
+        search_cache.clear()
+    search_cache[q_low] = hit
+    return hit
+
+async def refresh_leaderboard():
+    global cache_mtime
+    if dirty.is_set():
+        return  # unsaved scores in memory are newer than the file
+    mtime = leaderboard_mtime()
+    if mtime != cache_mtime:
+        data = await load_leaderboard()
+        if dirty.is_set():
+            return  # a score landed while we were reading; keep memory
+        set_leaderboard(data)
+        cache_mtime = mtime
 
 # ---------- API ----------
 @app.get("/health")
@@ -52,28 +182,62 @@ def health():
 
 @app.post("/scores/")
 async def add_score(score: Score):
-    global leaderboard
-    entry = score.dict()
-    leaderboard.append(entry)
-    leaderboard.sort(key=lambda x: x["score"], reverse=True)
-    save_leaderboard(leaderboard)
+    await refresh_leaderboard()
+    entry = score.model_dump()
+    # stays sorted: O(log n) search instead of a full re-sort per insert
+    i = bisect_right(leaderboard, -entry["score"], key=by_score_desc)
+    leaderboard.insert(i, entry)
+    names_lower.insert(i, lower_name(entry))
+    mark_dirty()
     return {"message": "Score added"}
 
-@app.get("/leaderboard/", response_model=List[Score])
-async def get_leaderboard(q: Optional[str] = Query(None, description="Filter by player name (case-insensitive)")):
-    global leaderboard
-    leaderboard = load_leaderboard()  # reload in case file changed
-    entries = leaderboard
-    if q:
-        q_low = q.lower()
-        entries = [e for e in leaderboard if q_low in e.get("player", "").lower()]
-    return entries[:50]
+@app.post("/scores/batch")
+async def add_scores(scores: List[Score]):
+    global leaderboard, names_lower
+    await refresh_leaderboard()
+    batch = sorted((score.model_dump() for score in scores), key=by_score_desc)
+    # both sides are sorted: one linear merge instead of re-sorting everything
+    merged = list(merge(
+        zip(leaderboard, names_lower),
+        ((e, lower_name(e)) for e in batch),
+        key=lambda pair: -pair[0]["score"],
+    ))
+    leaderboard = [e for e, _ in merged]
+    names_lower = [name for _, name in merged]
+    mark_dirty()
+    return {"message": f"{len(scores)} scores added"}
+
+# Entries are already plain dicts from our own file: return them as-is instead of
+# re-validating through response_model; `responses` keeps the schema in the docs.
+# Bodies are serialized once per leaderboard version and tagged with an ETag, so
+# the UI's repeated fetches are answered with 304 Not Modified until a change.
+@app.get("/leaderboard/", responses={200: {"model": List[Score]}})
+async def get_leaderboard(request: Request, q: Optional[str] = Query(None, description="Filter by player name (case-insensitive)")) -> Response:
+    await refresh_leaderboard()  # cheap stat; reload only if the file changed
+    key = q.lower() if q else ""
+    cached = response_cache.get(key)
+    if cached is None:
+        if key:
+            entries = [leaderboard[i] for i in search_leaderboard(key)[:50]]
+        else:
+            entries = leaderboard[:50]
+        body = orjson.dumps(entries)
+        # weak: GZipMiddleware sends this same tag on gzip and identity bodies
+        etag = 'W/"%s"' % blake2b(body, digest_size=8).hexdigest()
+        if len(response_cache) >= SEARCH_CACHE_SIZE:
+            response_cache.clear()
+        cached = response_cache[key] = (body, etag)
+    body, etag = cached
+    # no-cache: browsers may store the body but must revalidate with the ETag
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(body, media_type="application/json", headers=headers)
 
 @app.delete("/leaderboard/")
 async def clear_leaderboard():
-    global leaderboard
-    leaderboard = []
-    save_leaderboard(leaderboard)
+    set_leaderboard([])
+    mark_dirty()
     return {"message": "Leaderboard cleared"}
 
 # ---------- Minimal UI ----------
@@ -177,6 +341,13 @@ UI_HTML = """
 </html>
 """
 
+# The page is static: encode and tag it once at import time.
+UI_BYTES = UI_HTML.encode("utf-8")
+UI_ETAG = 'W/"%s"' % blake2b(UI_BYTES, digest_size=8).hexdigest()  # weak: also served gzipped
+UI_HEADERS = {"ETag": UI_ETAG, "Cache-Control": "public, max-age=3600"}
+
 @app.get("/ui", response_class=HTMLResponse)
-def ui():
-    return HTMLResponse(content=UI_HTML, status_code=200)
+def ui(request: Request):
+    if request.headers.get("if-none-match") == UI_ETAG:
+        return Response(status_code=304, headers=UI_HEADERS)
+    return HTMLResponse(content=UI_BYTES, headers=UI_HEADERS)
@@ -19,11 +19,12 @@ Env:
 import os
 import asyncio
 import random
+from collections import deque
 from math import cos, sin, pi
-from datetime import datetime
 
 import pygame
 import httpx
+import orjson
 
 # -----------------------------
 # Config & Grid Mapping
@@ -32,8 +33,16 @@ WIDTH, HEIGHT = 1200, 800
 CELL = 20  # snap size (all positions in grid units)
 GRID_W = WIDTH // CELL
 GRID_H = HEIGHT // CELL
+# (gx, gy) -> top-left pixel; looked up per drawn cell instead of re-multiplying
+CELL_PX = {(x, y): (x * CELL, y * CELL) for x in range(GRID_W) for y in range(GRID_H)}
+
+# Directions are small ints indexing these tables (no string compares per step)
+UP, DOWN, LEFT, RIGHT = 0, 1, 2, 3
+DIRS = ((0, -1), (0, 1), (-1, 0), (1, 0))  # (dx, dy) per direction
+OPPOSITE = (DOWN, UP, RIGHT, LEFT)
 
 SNAKE_FPS = 12  # grid steps per second
+IDLE_POLL = 0.05  # seconds between input polls on the static game over screen
 API_URL = os.getenv("API_URL", "http://api:8000")
 
 # -----------------------------
@@ -61,9 +70,15 @@ SHOW_GRID_LINES = False  # set True if you want grid lines over checkerboard
 # Pygame init
 # -----------------------------
 pygame.init()
-window = pygame.display.set_mode((WIDTH, HEIGHT))
+# SCALED goes through SDL's renderer (GPU texture upload instead of a software
+# window blit); fall back to a plain window if the driver refuses vsync.
+try:
+    window = pygame.display.set_mode((WIDTH, HEIGHT), pygame.DOUBLEBUF | pygame.SCALED, vsync=1)
+except pygame.error:
+    window = pygame.display.set_mode((WIDTH, HEIGHT), pygame.DOUBLEBUF)
 pygame.display.set_caption("Async Snake — Clean Grid")
-clock = pygame.time.Clock()
+# The game is keyboard-only: keep mouse events out of the queue entirely.
+pygame.event.set_blocked([pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEWHEEL])
 font = pygame.font.SysFont("consolas", 28)
 small_font = pygame.font.SysFont("consolas", 20)
 title_font = pygame.font.SysFont("consolas", 48)
@@ -71,14 +86,17 @@ title_font = pygame.font.SysFont("consolas", 48)
 # -----------------------------
 # Helpers (draw & grid)
 # -----------------------------
-def grid_to_rect(cell_xy):
-    """(gx, gy) -> pixel rect tuple (x, y, w, h)"""
-    gx, gy = cell_xy
-    return (gx * CELL, gy * CELL, CELL, CELL)
-
-def random_free_cell(occupied: set[tuple[int, int]]):
-    """Return a free (x, y) tuple on the grid, or None if full."""
-    free = [(x, y) for x in range(GRID_W) for y in range(GRID_H) if (x, y) not in occupied]
+def random_free_cell(occupied: set[tuple[int, int]], exclude=None):
+    """Return a free (x, y) tuple on the grid (also != exclude), or None if full."""
+    # Rejection sampling: while the board is mostly empty this takes ~1 try
+    # and never builds the full list of cells.
+    if len(occupied) < 0.9 * GRID_W * GRID_H:
+        while True:
+            cell = (random.randrange(GRID_W), random.randrange(GRID_H))
+            if cell not in occupied and cell != exclude:
+                return cell
+    free = [(x, y) for x in range(GRID_W) for y in range(GRID_H)
+            if (x, y) not in occupied and (x, y) != exclude]
     return random.choice(free) if free else None
 
 def draw_text(screen, msg, center_xy, color=HUD_TEXT, fnt=font):
@@ -86,20 +104,28 @@ def draw_text(screen, msg, center_xy, color=HUD_TEXT, fnt=font):
     rect = surf.get_rect(center=center_xy)
     screen.blit(surf, rect)
 
-def draw_checkerboard(screen):
+def render_checkerboard():
     """Subtle checkerboard background; optionally overlay faint grid lines."""
-    screen.fill(BG_A)
+    bg = pygame.Surface((WIDTH, HEIGHT)).convert()
+    bg.fill(BG_A)
     tile = pygame.Surface((CELL, CELL))
     tile.fill(BG_B)
     for y in range(GRID_H):
         start = y % 2
         for x in range(start, GRID_W, 2):
-            screen.blit(tile, (x * CELL, y * CELL))
+            bg.blit(tile, (x * CELL, y * CELL))
     if SHOW_GRID_LINES:
         for x in range(0, WIDTH, CELL):
-            pygame.draw.line(screen, GRID_LINES, (x, 0), (x, HEIGHT))
+            pygame.draw.line(bg, GRID_LINES, (x, 0), (x, HEIGHT))
         for y in range(0, HEIGHT, CELL):
-            pygame.draw.line(screen, GRID_LINES, (0, y), (WIDTH, y))
+            pygame.draw.line(bg, GRID_LINES, (0, y), (WIDTH, y))
+    return bg
+
+# The board never changes: render it once, then it's a single blit per frame.
+BG_SURFACE = render_checkerboard()
+
+def draw_checkerboard(screen):
+    screen.blit(BG_SURFACE, (0, 0))
 
 def draw_rounded_rect(surface, rect, color, radius=8):
     pygame.draw.rect(surface, color, rect, border_radius=radius)
@@ -109,8 +135,22 @@ def draw_shadow_rect(surface, rect, radius=8, offset=(2, 2), alpha=55):
     pygame.draw.rect(shadow, (0, 0, 0, alpha), (0, 0, rect[2], rect[3]), border_radius=radius)
     surface.blit(shadow, (rect[0] + offset[0], rect[1] + offset[1]))
 
-def draw_snake_segment(surface, cell_xy, color, is_head=False, direction=None):
-    x, y, w, h = grid_to_rect(cell_xy)
+# Sprites are drawn once per (kind, ...) key at the cell origin, then blitted.
+# Sized CELL + 2 so the segment drop shadow (offset 2px) fits.
+SPRITE_SIZE = CELL + 2
+SPRITES: dict[tuple, pygame.Surface] = {}
+
+def cached_sprite(key, paint, *args):
+    """Return the sprite for key, painting it with paint(surface, *args) on first use."""
+    sprite = SPRITES.get(key)
+    if sprite is None:
+        sprite = pygame.Surface((SPRITE_SIZE, SPRITE_SIZE), pygame.SRCALPHA).convert_alpha()
+        paint(sprite, *args)
+        SPRITES[key] = sprite
+    return sprite
+
+def paint_snake_segment(surface, color, is_head, direction):
+    x, y, w, h = 0, 0, CELL, CELL
     r = 8
     draw_shadow_rect(surface, (x, y, w, h), radius=r)
     draw_rounded_rect(surface, (x, y, w, h), color, radius=r)
@@ -121,12 +161,12 @@ def draw_snake_segment(surface, cell_xy, color, is_head=False, direction=None):
     # Directional “snout” triangle + eyes positioned by direction
     cx, cy = x + w // 2, y + h // 2
     tip = {
-        "UP":    (cx, y + 2),
-        "DOWN":  (cx, y + h - 2),
-        "LEFT":  (x + 2, cy),
-        "RIGHT": (x + w - 2, cy),
-    }[(direction or "RIGHT")]
-    if direction in ("UP", "DOWN"):
+        UP:    (cx, y + 2),
+        DOWN:  (cx, y + h - 2),
+        LEFT:  (x + 2, cy),
+        RIGHT: (x + w - 2, cy),
+    }[RIGHT if direction is None else direction]
+    if direction in (UP, DOWN):
         base_left  = (cx - w * 0.20, cy)
         base_right = (cx + w * 0.20, cy)
     else:
@@ -136,11 +176,11 @@ def draw_snake_segment(surface, cell_xy, color, is_head=False, direction=None):
 
     eye_r = max(2, CELL // 6)
     off = CELL // 4
-    if direction == "UP":
+    if direction == UP:
         eye1, eye2 = (x + off, y + off), (x + w - off, y + off)
-    elif direction == "DOWN":
+    elif direction == DOWN:
         eye1, eye2 = (x + off, y + h - off), (x + w - off, y + h - off)
-    elif direction == "LEFT":
+    elif direction == LEFT:
         eye1, eye2 = (x + off, y + off), (x + off, y + h - off)
     else:  # RIGHT
         eye1, eye2 = (x + w - off, y + off), (x + w - off, y + h - off)
@@ -148,28 +188,35 @@ def draw_snake_segment(surface, cell_xy, color, is_head=False, direction=None):
         pygame.draw.circle(surface, (255, 255, 255), e, eye_r)
         pygame.draw.circle(surface, (0, 0, 0), e, max(1, eye_r // 2))
 
-def draw_apple(surface, cell_xy):
-    x, y, w, h = grid_to_rect(cell_xy)
-    cx = x + w // 2
-    cy = y + h // 2
+def snake_segment_sprite(color, is_head=False, direction=None):
+    key = ("head", direction, color) if is_head else ("body", color)
+    return cached_sprite(key, paint_snake_segment, color, is_head, direction)
+
+def paint_apple(surface):
+    w = h = CELL
+    cx = w // 2
+    cy = h // 2
     radius = int(CELL * 0.42)
     pygame.draw.circle(surface, APPLE, (cx, cy), radius)
 
     # leaf
     leaf_w = int(CELL * 0.3)
     leaf_h = int(CELL * 0.18)
-    leaf_rect = pygame.Rect(cx + radius // 2 - leaf_w // 2, y + h // 6, leaf_w, leaf_h)
+    leaf_rect = pygame.Rect(cx + radius // 2 - leaf_w // 2, h // 6, leaf_w, leaf_h)
     draw_rounded_rect(surface, leaf_rect, LEAF, radius=leaf_h // 2)
 
     # highlight
     gloss = pygame.Surface((w, h), pygame.SRCALPHA)
     pygame.draw.circle(gloss, HIGHLIGHT, (int(w * 0.35), int(h * 0.35)), int(CELL * 0.18))
-    surface.blit(gloss, (x, y))
+    surface.blit(gloss, (0, 0))
+
+def apple_sprite():
+    return cached_sprite(("apple",), paint_apple)
 
-def draw_star(surface, cell_xy, color=BONUS, points=5, inner_ratio=0.46):
-    x, y, w, h = grid_to_rect(cell_xy)
-    cx = x + w / 2
-    cy = y + h / 2
+def paint_star(surface, color, points, inner_ratio):
+    w = h = CELL
+    cx = w / 2
+    cy = h / 2
     R = CELL * 0.45
     r = R * inner_ratio
     verts = []
@@ -181,31 +228,106 @@ def draw_star(surface, cell_xy, color=BONUS, points=5, inner_ratio=0.46):
 
     gloss = pygame.Surface((w, h), pygame.SRCALPHA)
     pygame.draw.circle(gloss, HIGHLIGHT, (int(w * 0.40), int(h * 0.35)), int(CELL * 0.16))
-    surface.blit(gloss, (x, y))
+    surface.blit(gloss, (0, 0))
+
+def star_sprite(color=BONUS, points=5, inner_ratio=0.46):
+    return cached_sprite(("star", color, points, inner_ratio), paint_star, color, points, inner_ratio)
+
+# Last rendered HUD pill; the text is only rasterized when the score changes.
+# One slot is enough: the score never goes back to an earlier value mid-game.
+HUD_PILL = {"score": None, "surface": None}
 
 def hud_pill(surface, score):
     pill_h = 44
     pill_w = 240
     pill_x = 20
     pill_y = 14
-    draw_rounded_rect(surface, (pill_x, pill_y, pill_w, pill_h), HUD_BG, radius=22)
-    draw_text(surface, f"Score: {score}", (pill_x + pill_w // 2, pill_y + pill_h // 2), HUD_TEXT, font)
+    if HUD_PILL["score"] != score:
+        pill = pygame.Surface((pill_w, pill_h), pygame.SRCALPHA).convert_alpha()
+        draw_rounded_rect(pill, (0, 0, pill_w, pill_h), HUD_BG, radius=22)
+        draw_text(pill, f"Score: {score}", (pill_w // 2, pill_h // 2), HUD_TEXT, font)
+        HUD_PILL["score"] = score
+        HUD_PILL["surface"] = pill
+    surface.blit(HUD_PILL["surface"], (pill_x, pill_y))
+
+# -----------------------------
+# Frame pacing
+# -----------------------------
+async def wait_next_frame(loop, deadline: float, fps: int) -> float:
+    """
+    Sleep on the event loop until the next frame deadline and return it.
+    Unlike Clock.tick (which blocks inside SDL), this lets the bonus spawner
+    and score worker run while the game waits for its next step.
+    """
+    deadline += 1 / fps
+    delay = deadline - loop.time()
+    if delay > 0:
+        await asyncio.sleep(delay)
+    else:
+        # running late: start a fresh schedule instead of bursting to catch up
+        deadline = loop.time()
+        await asyncio.sleep(0)
+    return deadline
+
+# -----------------------------
+# Input mapping
+# -----------------------------
+DIR_FOR_KEY = {
+    pygame.K_UP: UP, pygame.K_w: UP,
+    pygame.K_DOWN: DOWN, pygame.K_s: DOWN,
+    pygame.K_LEFT: LEFT, pygame.K_a: LEFT,
+    pygame.K_RIGHT: RIGHT, pygame.K_d: RIGHT,
+}
+
+def poll_events():
+    """
+    QUIT/KEYDOWN events since the last call. Only these become Python objects;
+    the rest of the queue (window events, key-ups, ...) is dropped in C.
+    """
+    events = pygame.event.get((pygame.QUIT, pygame.KEYDOWN))
+    pygame.event.clear(pump=False)
+    return events
 
 # -----------------------------
 # Async API
 # -----------------------------
-async def submit_score(player_name: str, final_score: int):
+# One client for the whole session: keeps the connection alive between games
+# instead of a fresh pool + TCP handshake per submitted score. score_worker
+# posts one request at a time, so a single pooled connection is all it needs.
+http_client = httpx.AsyncClient(
+    base_url=API_URL,
+    timeout=5,
+    limits=httpx.Limits(max_connections=1, max_keepalive_connections=1),
+)
+JSON_HEADERS = {"content-type": "application/json"}
+
+# Game over only enqueues; score_worker does the network I/O in the background.
+score_queue: asyncio.Queue[dict] = asyncio.Queue()
+
+def submit_score(player_name: str, final_score: int):
     if not API_URL:
         return
-    try:
-        async with httpx.AsyncClient(timeout=5) as client:
-            await client.post(
-                f"{API_URL}/scores/",
-                json={"player": player_name, "score": final_score, "date": datetime.now().isoformat()},
-            )
-    except Exception:
-        # keep game responsive even if API is down
-        pass
+    # no "date": the API stamps the score when it arrives
+    score_queue.put_nowait({"player": player_name, "score": final_score})
+
+async def score_worker():
+    """Drain score_queue; scores that piled up meanwhile go out as one batch."""
+    while True:
+        batch = [await score_queue.get()]
+        while not score_queue.empty():
+            batch.append(score_queue.get_nowait())
+        try:
+            if len(batch) == 1:
+                path, body = "/scores/", orjson.dumps(batch[0])
+            else:
+                path, body = "/scores/batch", orjson.dumps(batch)
+            await http_client.post(path, content=body, headers=JSON_HEADERS)
+        except Exception:
+            # keep game responsive even if API is down
+            pass
+        finally:
+            for _ in batch:
+                score_queue.task_done()
 
 # -----------------------------
 # Async bonus spawner
@@ -216,14 +338,12 @@ async def spawn_bonus_food(state: dict):
     Uses only grid cells and never overlaps the snake or normal fruit.
     """
     while state["running"]:
-        await asyncio.sleep(random.randint(5, 12))
+        await asyncio.sleep(random.uniform(5, 12))  # off the 1/SNAKE_FPS frame grid
         if not state["running"]:
             break
 
-        occupied = set(map(tuple, state["snake_body"]))
-        if state["fruit"] is not None:
-            occupied.add(tuple(state["fruit"]))
-        pos = random_free_cell(occupied)
+        # live occupancy set from game_loop; the fruit is excluded separately
+        pos = random_free_cell(state["occupied"], exclude=state["fruit"])
         if pos is None:
             continue
 
@@ -251,8 +371,24 @@ async def name_screen() -> str | None:
     input_x = (WIDTH - input_w) // 2
     input_y = (HEIGHT // 2)
 
+    # Everything but the typed name and the caret is static: draw it once.
+    static = BG_SURFACE.copy()
+    draw_text(static, "SNAKE", (WIDTH // 2, HEIGHT // 2 - 140), HUD_TEXT, title_font)
+    draw_text(static, "Enter your name", (WIDTH // 2, HEIGHT // 2 - 80), HUD_TEXT, font)
+    box_rect = pygame.Rect(input_x, input_y, input_w, input_h)
+    draw_shadow_rect(static, (box_rect.x, box_rect.y, box_rect.w, box_rect.h), radius=14, alpha=65)
+    pygame.draw.rect(static, HUD_BG, box_rect, border_radius=14)
+    draw_text(static, "Press Enter to continue • Esc to quit",
+              (WIDTH // 2, HEIGHT // 2 + 80), HUD_TEXT, small_font)
+
+    text_surf = None
+    shown = None
+
+    loop = asyncio.get_running_loop()
+    next_frame = loop.time()
+
     while True:
-        for event in pygame.event.get():
+        for event in poll_events():
             if event.type == pygame.QUIT:
                 return None
             if event.type == pygame.KEYDOWN:
@@ -273,18 +409,12 @@ async def name_screen() -> str | None:
         caret_on = caret_timer < 20
 
         # render
-        draw_checkerboard(window)
-        draw_text(window, "SNAKE", (WIDTH // 2, HEIGHT // 2 - 140), HUD_TEXT, title_font)
-        draw_text(window, "Enter your name", (WIDTH // 2, HEIGHT // 2 - 80), HUD_TEXT, font)
-
-        # input box
-        box_rect = pygame.Rect(input_x, input_y, input_w, input_h)
-        draw_shadow_rect(window, (box_rect.x, box_rect.y, box_rect.w, box_rect.h), radius=14, alpha=65)
-        pygame.draw.rect(window, HUD_BG, box_rect, border_radius=14)
-
-        # name text + caret
-        shown = name if name else ""
-        text_surf = font.render(shown, True, HUD_TEXT)
+        window.blit(static, (0, 0))
+
+        # name text (re-rendered only when it changes) + caret
+        if name != shown:
+            shown = name
+            text_surf = font.render(shown, True, HUD_TEXT)
         window.blit(text_surf, (box_rect.x + 16, box_rect.y + (input_h - text_surf.get_height()) // 2))
 
         if caret_on:
@@ -293,12 +423,8 @@ async def name_screen() -> str | None:
             cy2 = box_rect.y + input_h - 14
             pygame.draw.line(window, HUD_TEXT, (cx, cy1), (cx, cy2), 2)
 
-        draw_text(window, "Press Enter to continue • Esc to quit",
-                  (WIDTH // 2, HEIGHT // 2 + 80), HUD_TEXT, small_font)
-
         pygame.display.flip()
-        clock.tick(60)
-        await asyncio.sleep(0)
+        next_frame = await wait_next_frame(loop, next_frame, 60)
 
 # -----------------------------
 # Core game
@@ -311,68 +437,55 @@ async def game_loop(player_name="Player") -> str:
     """
     # snake initial state (length 3, centered)
     head = (GRID_W // 2, GRID_H // 2)
-    snake_body: list[tuple[int, int]] = [head, (head[0]-1, head[1]), (head[0]-2, head[1])]
-    direction = "RIGHT"
-    pending_direction = "RIGHT"
+    # deque: O(1) push at the head / pop at the tail; `occupied` mirrors it
+    # so self-collision and free-cell checks are set lookups, not list scans
+    snake_body: deque[tuple[int, int]] = deque([head, (head[0]-1, head[1]), (head[0]-2, head[1])])
+    occupied: set[tuple[int, int]] = set(snake_body)
+    direction = RIGHT
+    pending_direction = RIGHT
 
     # fruit (normal)
-    fruit = random_free_cell(set(snake_body))
+    fruit = random_free_cell(occupied)
     score = 0
     running = True
 
     # shared state for async task
     state = {
         "running": True,
-        "snake_body": snake_body,
+        "occupied": occupied,
         "fruit": fruit,
         "bonus_fruit": None,
         "bonus_visible": False,
     }
 
-    bonus_task = asyncio.create_task(spawn_bonus_food(state))
+    # one loop lookup per game; frames and tasks reuse it
+    loop = asyncio.get_running_loop()
+    bonus_task = loop.create_task(spawn_bonus_food(state))
+    next_frame = loop.time()
 
     try:
         while running:
             # ---------- input ----------
-            for event in pygame.event.get():
+            for event in poll_events():
                 if event.type == pygame.QUIT:
                     running = False
                     break
-                elif event.type == pygame.KEYDOWN:
-                    if event.key in (pygame.K_UP, pygame.K_w) and direction != "DOWN":
-                        pending_direction = "UP"
-                    elif event.key in (pygame.K_DOWN, pygame.K_s) and direction != "UP":
-                        pending_direction = "DOWN"
-                    elif event.key in (pygame.K_LEFT, pygame.K_a) and direction != "RIGHT":
-                        pending_direction = "LEFT"
-                    elif event.key in (pygame.K_RIGHT, pygame.K_d) and direction != "LEFT":
-                        pending_direction = "RIGHT"
-                    elif event.key == pygame.K_ESCAPE:
-                        # Exit immediately from gameplay
-                        state["running"] = False
-                        return "quit"
+                elif event.key == pygame.K_ESCAPE:
+                    # Exit immediately from gameplay
+                    state["running"] = False
+                    return "quit"
+                else:
+                    d = DIR_FOR_KEY.get(event.key)
+                    if d is not None and d != OPPOSITE[direction]:
+                        pending_direction = d
 
             direction = pending_direction
 
             # ---------- update (one grid step) ----------
             hx, hy = snake_body[0]
-            #if direction == "UP":
-            #    new_head = (hx, (hy - 1) % GRID_H)
-            #elif direction == "DOWN":
-            #    new_head = (hx, (hy + 1) % GRID_H)
-            #elif direction == "LEFT":
-            #    new_head = ((hx - 1) % GRID_W, hy)
-            #else:  # RIGHT
-            #    new_head = ((hx + 1) % GRID_W, hy)
-
-            if direction == "UP":
-                new_head = (hx, hy - 1)
-            elif direction == "DOWN":
-                new_head = (hx, hy + 1)
-            elif direction == "LEFT":
-                new_head = (hx - 1, hy)
-            else:  # RIGHT
-                new_head = (hx + 1, hy)
+            dx, dy = DIRS[direction]
+            #new_head = ((hx + dx) % GRID_W, (hy + dy) % GRID_H)  # wrap-around variant
+            new_head = (hx + dx, hy + dy)
 
             # check wall collision
             if (
@@ -383,20 +496,24 @@ async def game_loop(player_name="Player") -> str:
                 return await game_over(player_name, score)
 
 
+            # normal fruit collision (grow at head)
+            ate_fruit = state["fruit"] is not None and new_head == state["fruit"]
+            if not ate_fruit:
+                # keep length: drop tail (before the collision test, since
+                # the head may move into the cell the tail just left)
+                occupied.discard(snake_body.pop())
+            hit_self = new_head in occupied
+
             # insert new head
-            snake_body.insert(0, new_head)
+            snake_body.appendleft(new_head)
+            occupied.add(new_head)
 
-            # normal fruit collision (grow at head)
-            if state["fruit"] is not None and new_head == tuple(state["fruit"]):
+            if ate_fruit:
                 score += 10
-                occupied = set(map(tuple, snake_body))
                 state["fruit"] = random_free_cell(occupied)
-            else:
-                # keep length: drop tail
-                snake_body.pop()
 
             # bonus fruit collision (grow TAIL)
-            if state["bonus_visible"] and state["bonus_fruit"] is not None and new_head == tuple(state["bonus_fruit"]):
+            if state["bonus_visible"] and state["bonus_fruit"] is not None and new_head == state["bonus_fruit"]:
                 score += 50
                 state["bonus_visible"] = False
                 state["bonus_fruit"] = None
@@ -411,52 +528,50 @@ async def game_loop(player_name="Player") -> str:
                     dy = 0 if dy == 0 else (1 if dy > 0 else -1)
                 else:
                     # fallback: opposite to head direction
-                    if direction == "UP":
-                        dx, dy = 0, 1
-                    elif direction == "DOWN":
-                        dx, dy = 0, -1
-                    elif direction == "LEFT":
-                        dx, dy = 1, 0
-                    else:
-                        dx, dy = -1, 0
+                    dx, dy = DIRS[OPPOSITE[direction]]
 
 
                 tail_base = snake_body[-1]
                 new_tail = ((tail_base[0] + dx) % GRID_W, (tail_base[1] + dy) % GRID_H)
-                if new_tail not in snake_body:
+                if new_tail not in occupied:
                     snake_body.append(new_tail)
+                    occupied.add(new_tail)
 
-            # self-collision ends game
             # self-collision ends game (go to Game Over screen)
-            if new_head in snake_body[1:]:
+            if hit_self:
                 state["running"] = False
                 return await game_over(player_name, score)
 
 
             # ---------- render ----------
             draw_checkerboard(window)
-            # fruits
+            # fruits + snake go out in one Surface.blits call, in draw order
+            blit_list = []
             if state["fruit"] is not None:
-                draw_apple(window, state["fruit"])
+                blit_list.append((apple_sprite(), CELL_PX[state["fruit"]]))
             if state["bonus_visible"] and state["bonus_fruit"] is not None:
-                draw_star(window, state["bonus_fruit"], color=BONUS)
-            # snake
+                blit_list.append((star_sprite(BONUS), CELL_PX[state["bonus_fruit"]]))
+            # snake: head sprite, then alternating body colors
+            body_tiles = (snake_segment_sprite(SNAKE_BODY), snake_segment_sprite(SNAKE_BODY_2))
+            sprite = snake_segment_sprite(SNAKE_HEAD, is_head=True, direction=direction)
             for i, cell in enumerate(snake_body):
-                color = SNAKE_HEAD if i == 0 else (SNAKE_BODY if i % 2 == 0 else SNAKE_BODY_2)
-                draw_snake_segment(window, cell, color, is_head=(i == 0), direction=(direction if i == 0 else None))
+                blit_list.append((sprite, CELL_PX[cell]))
+                sprite = body_tiles[(i + 1) % 2]
+            window.blits(blit_list, doreturn=False)
             # HUD
             hud_pill(window, score)
 
             pygame.display.flip()
-            clock.tick(SNAKE_FPS)
-            await asyncio.sleep(0)  # yield to async tasks
+            next_frame = await wait_next_frame(loop, next_frame, SNAKE_FPS)
 
     finally:
         state["running"] = False
         bonus_task.cancel()
         try:
             await bonus_task
-        except Exception:
+        except (asyncio.CancelledError, Exception):
+            # CancelledError is a BaseException: it must be caught explicitly
+            # or it escapes game_loop and ends the program on retry/quit
             pass
 
     # Game ended: show game over screen and return user choice
@@ -466,11 +581,11 @@ async def game_loop(player_name="Player") -> str:
 # Game Over
 # -----------------------------
 async def game_over(player_name, score) -> str:
-    # submit score, but do not block gameplay responsiveness on failure
-    await submit_score(player_name, score)
+    # queue the score; the game over screen never waits on the network
+    submit_score(player_name, score)
 
     # dim board
-    overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
+    overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA).convert_alpha()
     overlay.fill((0, 0, 0, 120))
     window.blit(overlay, (0, 0))
 
@@ -487,7 +602,7 @@ async def game_over(player_name, score) -> str:
 
     # wait for user choice
     while True:
-        for event in pygame.event.get():
+        for event in poll_events():
             if event.type == pygame.QUIT:
                 return "quit"
             if event.type == pygame.KEYDOWN:
@@ -495,27 +610,37 @@ async def game_over(player_name, score) -> str:
                     return "retry"
                 elif event.key == pygame.K_ESCAPE:
                     return "quit"
-        await asyncio.sleep(0.01)
+        # nothing animates here: 20 polls/s is plenty for a key press
+        await asyncio.sleep(IDLE_POLL)
 
 # -----------------------------
 # Entrypoint
 # -----------------------------
 async def main():
-    # Name screen
-    name = await name_screen()
-    if name is None:
+    loop = asyncio.get_running_loop()
+    worker = loop.create_task(score_worker())
+    try:
+        # Name screen
+        name = await name_screen()
+        if name is None:
+            return
+
+        # Gameplay loop with retry support
+        while True:
+            result = await game_loop(name)
+            if result == "retry":
+                continue   # restart game with same name
+            else:
+                break      # "quit" or window close
+    finally:
+        # give queued scores a moment to reach the API before exiting
+        try:
+            await asyncio.wait_for(score_queue.join(), timeout=2)
+        except asyncio.TimeoutError:
+            pass
+        worker.cancel()
+        await http_client.aclose()
         pygame.quit()
-        return
-
-    # Gameplay loop with retry support
-    while True:
-        result = await game_loop(name)
-        if result == "retry":
-            continue   # restart game with same name
-        else:
-            break      # "quit" or window close
-
-    pygame.quit()
 
 if __name__ == "__main__":
     try: